@@ -1,4 +1,6 @@
 import argparse
+import logging
+import sys
 
 from .metadata import configure_command, post_images_command, unschedule_all_command
 
@@ -61,6 +63,9 @@ def build_arg_parser() -> argparse.ArgumentParser:
 
 
 def main() -> None:
+    # Progress output goes through logging; keep it looking like plain prints.
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     parser = build_arg_parser()
     args = parser.parse_args()
     try:
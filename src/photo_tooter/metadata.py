@@ -1,39 +1,74 @@
-import json
+import atexit
+import functools
+import logging
 import os
 import re
 import subprocess
+import threading
+import time
+import warnings
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+import orjson
+import requests
 from mastodon import Mastodon, MastodonAPIError, MastodonUnauthorizedError
+from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 APP_NAME = "photo-tooter"
 
+log = logging.getLogger(__name__)
+
 CONFIG_DIR = Path(f"~/.config/{APP_NAME}").expanduser()
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
-IMAGE_EXTS = {
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".heic",
-    ".heif",
-    ".tif",
-    ".tiff",
-    ".webp",
-}
+CACHE_DIR = Path(f"~/.cache/{APP_NAME}").expanduser()
+EXIF_CACHE_FILE = CACHE_DIR / "exif-cache.json"
+
+# Bump whenever extract_metadata's output for the same file could change
+# (e.g. hashtag cleaning rules), so stale cached results are discarded.
+EXIF_CACHE_VERSION = 3
+
+# Upper bound on cached files; the least recently used are dropped first.
+EXIF_CACHE_MAX_ENTRIES = 10_000
+
+# Lowercase extensions, compared against os.path.splitext(name)[1].lower()
+IMAGE_EXTS: frozenset[str] = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".heic",
+        ".heif",
+        ".tif",
+        ".tiff",
+        ".webp",
+    }
+)
+
+# Images processed concurrently by `post`; also sizes the HTTP connection pool
+MAX_POST_WORKERS = 8
 
 # ----------------- Config ----------------- #
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict[str, Any]:
+    """
+    Read and validate the config file. The result is cached for the life of
+    the process and shared between callers, so do not mutate it.
+    """
     if not CONFIG_FILE.exists():
         raise RuntimeError(f"Config file not found. Run `{APP_NAME} configure` first.")
     try:
-        with CONFIG_FILE.open("r", encoding="utf-8") as f:
-            cfg = json.load(f)
-    except json.JSONDecodeError as e:
+        cfg = orjson.loads(CONFIG_FILE.read_bytes())
+    except orjson.JSONDecodeError as e:
         raise RuntimeError(f"Config file is corrupted: {CONFIG_FILE}\n{e}") from e
 
     if "base_url" not in cfg or "access_token" not in cfg:
@@ -50,8 +85,9 @@ def save_config(base_url: str, access_token: str) -> None:
         "base_url": base_url.strip().rstrip("/"),
         "access_token": access_token.strip(),
     }
-    with CONFIG_FILE.open("w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2)
+    with CONFIG_FILE.open("wb") as f:
+        f.write(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    load_config.cache_clear()
 
     try:
         os.chmod(CONFIG_FILE, 0o600)
@@ -81,34 +117,244 @@ def configure_command() -> None:
     print(f"You can now post with: {APP_NAME} post PATH")
 
 
+def build_http_session() -> requests.Session:
+    """
+    HTTP session shared by every API call, so media uploads and status posts
+    reuse pooled keep-alive connections instead of a new TLS handshake each.
+    """
+    # urllib3 only retries idempotent methods by default, so a failed
+    # status_post is never silently sent twice. 429s are left to Mastodon.py's
+    # own rate-limit handling.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_POST_WORKERS,
+        max_retries=retries,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def build_mastodon_client() -> Mastodon:
     cfg = load_config()
     return Mastodon(
         api_base_url=cfg["base_url"],
         access_token=cfg["access_token"],
+        session=build_http_session(),
     )
 
 
+# ----------------- Metadata cache ----------------- #
+
+# Extracted metadata persisted across runs, so retrying a failed batch
+# doesn't re-read every image. Loaded lazily, saved once at exit.
+# Each entry is [title, description, alt_text, hashtags, last_used].
+_exif_cache: dict[str, list[Any]] | None = None
+_exif_cache_dirty = False
+_exif_cache_lock = threading.Lock()
+
+
+def _exif_cache_key(path: Path) -> str | None:
+    """Cache key that changes whenever the file is replaced or edited."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{os.path.abspath(path)}|{st.st_size}|{int(st.st_mtime)}"
+
+
+def _is_valid_cache_entry(entry: Any) -> bool:
+    """A cached [title, description, alt_text, hashtags, last_used] list."""
+    if not isinstance(entry, list) or len(entry) != 5:
+        return False
+    *texts, hashtags, last_used = entry
+    return (
+        all(t is None or isinstance(t, str) for t in texts)
+        and isinstance(hashtags, list)
+        and all(isinstance(h, str) for h in hashtags)
+        and isinstance(last_used, int)
+    )
+
+
+def _get_exif_cache() -> dict[str, list[Any]]:
+    global _exif_cache
+    with _exif_cache_lock:
+        if _exif_cache is None:
+            try:
+                data = orjson.loads(EXIF_CACHE_FILE.read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                data = None
+            entries = None
+            if isinstance(data, dict) and data.get("version") == EXIF_CACHE_VERSION:
+                entries = data.get("entries")
+            # Best effort: silently drop anything that doesn't look right
+            # rather than failing the run over a damaged cache file.
+            if isinstance(entries, dict):
+                _exif_cache = {
+                    k: v for k, v in entries.items() if _is_valid_cache_entry(v)
+                }
+            else:
+                _exif_cache = {}
+            atexit.register(_save_exif_cache)
+        return _exif_cache
+
+
+def _save_exif_cache() -> None:
+    global _exif_cache_dirty
+    with _exif_cache_lock:
+        if not _exif_cache_dirty or _exif_cache is None:
+            return
+        entries = _exif_cache
+        # Keep the file from growing forever by evicting the least recently
+        # used entries. Deliberately no stat() per entry: that is slow on big
+        # caches, and would evict everything on an unmounted external drive.
+        if len(entries) > EXIF_CACHE_MAX_ENTRIES:
+            newest = sorted(entries.items(), key=lambda kv: kv[1][4])
+            entries = dict(newest[-EXIF_CACHE_MAX_ENTRIES:])
+        payload = orjson.dumps({"version": EXIF_CACHE_VERSION, "entries": entries})
+        _exif_cache_dirty = False
+
+    # Best effort: a cache we can't write just means re-reading next time.
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = EXIF_CACHE_FILE.with_suffix(".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, EXIF_CACHE_FILE)
+    except OSError as e:
+        log.debug("Could not write metadata cache %s: %s", EXIF_CACHE_FILE, e)
+
+
+def _cached_metadata(
+    key: str | None,
+) -> tuple[str | None, str | None, str | None, list[str]] | None:
+    """Look up a key from _exif_cache_key(); a hit refreshes its last_used."""
+    global _exif_cache_dirty
+    if key is None:
+        return None
+    cache = _get_exif_cache()
+    with _exif_cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        entry[4] = int(time.time())
+        _exif_cache_dirty = True
+    title, description, alt_text, hashtags, _last_used = entry
+    return title, description, alt_text, list(hashtags)
+
+
+def _store_metadata(
+    key: str | None,
+    metadata: tuple[str | None, str | None, str | None, list[str]],
+) -> None:
+    global _exif_cache_dirty
+    if key is None:
+        return
+    cache = _get_exif_cache()
+    with _exif_cache_lock:
+        cache[key] = [*metadata, int(time.time())]
+        _exif_cache_dirty = True
+
+
 # ----------------- EXIF ----------------- #
 
 
+# Only the tags extract_metadata / build_hashtags_from_exif_subject read.
+# -n skips print conversion and -fast skips scanning for JPEG trailers.
+# Not -fast2: that stops PNG processing at IDAT, and exiftool itself writes
+# PNG XMP after IDAT by default, so Title/Description would be missed.
+EXIFTOOL_TAGS = (
+    "-n",
+    "-fast",
+    "-Title",
+    "-Description",
+    "-AltTextAccessibility",
+    "-Subject",
+    "-WeightedFlatSubject",
+)
+
+
+# Formats Pillow can pull the XMP packet from. HEIC/HEIF always go through
+# exiftool, which stays authoritative for them.
+FAST_READ_EXTS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff", ".webp"})
+
+_RDF = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}"
+_XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+
+# exiftool tag name → XMP property, for the tags in EXIFTOOL_TAGS
+_XMP_ALT_PROPS = {
+    "Title": "{http://purl.org/dc/elements/1.1/}title",
+    "Description": "{http://purl.org/dc/elements/1.1/}description",
+    "AltTextAccessibility": (
+        "{http://iptc.org/std/Iptc4xmpCore/1.0/xmlns/}AltTextAccessibility"
+    ),
+}
+_XMP_BAG_PROPS = {
+    "Subject": "{http://purl.org/dc/elements/1.1/}subject",
+    "WeightedFlatSubject": "{http://ns.adobe.com/lightroom/1.0/}weightedFlatSubject",
+}
+
+
+def _fast_read_tags(path: Path) -> dict[str, Any] | None:
+    """
+    Read the tags we need straight from the image's XMP packet, in-process.
+    Returns a dict shaped like exiftool's JSON output, or None when the file
+    should go through exiftool instead (unsupported format, no XMP, neither
+    Title nor Description present, or anything that fails to parse).
+    """
+    if os.path.splitext(path.name)[1].lower() not in FAST_READ_EXTS:
+        return None
+    try:
+        # We only read the header, never decode pixels, so Pillow's
+        # decompression-bomb warning for very large photos is just noise.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            with Image.open(path) as im:
+                xmp = im.info.get("xmp")
+        if not xmp:
+            return None
+        root = ET.fromstring(xmp)
+    except Exception:
+        # Only an optimization; exiftool will report real problems.
+        return None
+
+    meta: dict[str, Any] = {"SourceFile": str(path)}
+    for desc in root.iter(f"{_RDF}Description"):
+        for tag, prop in _XMP_ALT_PROPS.items():
+            el = desc.find(prop)
+            if el is None:
+                continue
+            # Same keys as exiftool's JSON: x-default under the plain tag name,
+            # every other language as "Tag-<lang>" (e.g. "Title-de").
+            for li in el.iter(f"{_RDF}li"):
+                if not (li.text and li.text.strip()):
+                    continue
+                lang = li.get(_XML_LANG, "x-default")
+                key = tag if lang == "x-default" else f"{tag}-{lang}"
+                meta.setdefault(key, li.text)
+        for tag, prop in _XMP_BAG_PROPS.items():
+            el = desc.find(prop)
+            if el is None or tag in meta:
+                continue
+            items = [li.text for li in el.iter(f"{_RDF}li") if li.text]
+            if items:
+                meta[tag] = items
+
+    if "Title" not in meta and "Description" not in meta:
+        return None
+    return meta
+
+
 def run_exiftool(path: Path) -> dict[str, Any]:
+    meta = _fast_read_tags(path)
+    if meta is not None:
+        return meta
+
     try:
         result = subprocess.run(
-            [
-                "exiftool",
-                "-json",
-                "-Title",
-                "-Description",
-                "-AltTextAccessibility",
-                "-ExtDescrAccessibility",
-                "-Subject",
-                "-WeightedFlatSubject",
-                "-HierarchicalSubject",
-                str(path),
-            ],
+            ["exiftool", "-json", *EXIFTOOL_TAGS, str(path)],
             capture_output=True,
-            text=True,
             check=True,
         )
     except FileNotFoundError:
@@ -116,45 +362,117 @@ def run_exiftool(path: Path) -> dict[str, Any]:
             "exiftool not found. Install via: brew install exiftool"
         ) from None
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(
-            f"Error running exiftool on {path}: {e.stderr.strip()}"
-        ) from e
+        stderr = e.stderr.decode(errors="replace").strip()
+        raise RuntimeError(f"Error running exiftool on {path}: {stderr}") from e
 
-    data = json.loads(result.stdout)
+    # exiftool emits UTF-8; parse the raw bytes without a text decode pass
+    data = orjson.loads(result.stdout)
     if not isinstance(data, list) or not data:
         raise RuntimeError(f"Unexpected exiftool JSON format for {path}")
     return data[0]
 
 
+def run_exiftool_batch(paths: list[Path]) -> dict[Path, dict[str, Any]]:
+    """
+    Read metadata for many images with a single exiftool process.
+    Images whose XMP can be read in-process are never sent to exiftool.
+    Paths are passed on stdin (-@ -) so long batches don't hit ARG_MAX.
+    They are made absolute first, because exiftool reads argfile lines that
+    start with "#" as comments and "-" as options.
+    Files exiftool could not read are simply missing from the result;
+    callers fall back to run_exiftool() to get a per-file error.
+    """
+    metas: dict[Path, dict[str, Any]] = {}
+    misses: list[Path] = []
+    for p in paths:
+        meta = _fast_read_tags(p)
+        if meta is None:
+            misses.append(p)
+        else:
+            metas[p] = meta
+
+    if not misses:
+        return metas
+
+    # exiftool echoes each argument back as SourceFile; map it to our Path
+    by_absolute = {p.absolute(): p for p in misses}
+    try:
+        result = subprocess.run(
+            ["exiftool", "-json", *EXIFTOOL_TAGS, "-@", "-"],
+            input=b"\n".join(os.fsencode(p) for p in by_absolute),
+            capture_output=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "exiftool not found. Install via: brew install exiftool"
+        ) from None
+
+    # exiftool exits non-zero if *any* file failed, but still emits JSON
+    # for the ones it could read.
+    try:
+        data = orjson.loads(result.stdout) if result.stdout.strip() else []
+    except orjson.JSONDecodeError:
+        return metas
+    if not isinstance(data, list):
+        return metas
+
+    for item in data:
+        if isinstance(item, dict) and "SourceFile" in item:
+            source = Path(item["SourceFile"])
+            metas[by_absolute.get(source, source)] = item
+    return metas
+
+
 def _extract_lang_alt(value: Any) -> str | None:
-    if isinstance(value, str):
+    # Plain strings are by far the common case in real exiftool output
+    if type(value) is str:
         return value.strip() or None
     if isinstance(value, dict):
+        get = value.get
         for key in ("en-US", "en", "x-default"):
-            if key in value and isinstance(value[key], str) and value[key].strip():
-                return value[key].strip()
+            v = get(key)
+            if isinstance(v, str):
+                v = v.strip()
+                if v:
+                    return v
         for v in value.values():
-            if isinstance(v, str) and v.strip():
-                return v.strip()
+            if isinstance(v, str):
+                v = v.strip()
+                if v:
+                    return v
+    return None
+
+
+def _first_str(value: Any) -> str | None:
+    """
+    Normalize a single-valued exiftool field: take the first item of a list,
+    strip it, and return None for anything empty or not a string.
+    """
+    if type(value) is list:
+        value = value[0] if value else None
+    if type(value) is str:
+        return value.strip() or None
     return None
 
 
 def extract_metadata(
     path: Path,
+    meta_cache: dict[Path, dict[str, Any]] | None = None,
+    cache_key: str | None = None,
 ) -> tuple[str | None, str | None, str | None, list[str]]:
-    meta = run_exiftool(path)
+    # Callers that already looked the file up pass its key to skip a stat()
+    if cache_key is None:
+        cache_key = _exif_cache_key(path)
+    cached = _cached_metadata(cache_key)
+    if cached is not None:
+        return cached
 
-    # Title
-    title = meta.get("Title")
-    if isinstance(title, list):
-        title = title[0]
-    title = title.strip() if isinstance(title, str) else None
+    meta = meta_cache.get(path) if meta_cache else None
+    if meta is None:
+        meta = run_exiftool(path)
 
-    # Description
-    description = meta.get("Description")
-    if isinstance(description, list):
-        description = description[0]
-    description = description.strip() if isinstance(description, str) else None
+    title = _first_str(meta.get("Title"))
+    description = _first_str(meta.get("Description"))
 
     # Alt text
     alt_raw = (
@@ -167,32 +485,47 @@ def extract_metadata(
     # Hashtags from Subject / WeightedFlatSubject
     hashtags = build_hashtags_from_exif_subject(meta)
 
-    return title, description, alt_text, hashtags
+    result = (title, description, alt_text, hashtags)
+    _store_metadata(cache_key, result)
+    return result
+
+
+# (has title, has description) → status text builder
+_STATUS_TEXT_BUILDERS = {
+    (True, True): lambda title, description: f"{title} — {description}",
+    (False, True): lambda title, description: description,
+    (True, False): lambda title, description: title,
+}
 
 
 def build_default_status_text(title, description):
-    if title and description:
-        return f"{title} — {description}"
-    if description:
-        return description
-    if title:
-        return title
-    raise RuntimeError(
-        "No title or description found in metadata. Use --text to specify manually."
-    )
+    build = _STATUS_TEXT_BUILDERS.get((bool(title), bool(description)))
+    if build is None:
+        raise RuntimeError(
+            "No title or description found in metadata. Use --text to specify manually."
+        )
+    return build(title, description)
 
 
 # ----------------- Hashtags ----------------- #
 
-GENERIC_KEYWORDS = {
-    "photography",
-    "photo",
-    "photos",
-    "image",
-    "images",
-    "picture",
-    "pictures",
-}
+# Exact-match stoplist (compared lowercased). A plain frozenset is the right
+# tool at this size; only reach for a multi-pattern matcher if substring or
+# prefix filters are ever needed.
+GENERIC_KEYWORDS = frozenset(
+    {
+        "photography",
+        "photo",
+        "photos",
+        "image",
+        "images",
+        "picture",
+        "pictures",
+    }
+)
+
+# Parenthetical species names in subject keywords
+_PAREN_SUB = re.compile(r"\s*\(.*?\)").sub
 
 
 def _split_subject_values(value: Any) -> list[str]:
@@ -229,7 +562,7 @@ def _clean_subject_keyword(raw: str) -> str | None:
 
     # Remove everything in parentheses:
     # "Saguaro cactus (Carnegiea gigantea)" → "Saguaro cactus"
-    s = re.sub(r"\s*\(.*?\)", "", s).strip()
+    s = _PAREN_SUB("", s).strip()
     if not s:
         return None
 
@@ -247,20 +580,28 @@ def _clean_subject_keyword(raw: str) -> str | None:
 def _to_hashtag(keyword: str) -> str:
     """
     Convert a cleaned keyword string to a CamelCase hashtag:
-    - Remove punctuation ("Mt. Ranier" -> "Mt Ranier")
+    - Treat punctuation as a word break ("Mt. Ranier" -> "Mt Ranier")
     - Collapse spaces
     - CamelCase words
+    Done in a single pass over the characters; no regex needed.
     """
-    # Remove punctuation that breaks hashtags
-    cleaned = re.sub(r"[^\w\s]", " ", keyword)  # Replace punctuation with space
-
-    # Normalize whitespace
-    words = cleaned.split()
-    if not words:
+    out = ["#"]
+    word: list[str] = []
+    for c in keyword:
+        # Same character class as regex \w: letters, digits, underscore
+        if c.isalnum() or c == "_":
+            word.append(c)
+        elif word:
+            # Whole-word capitalize() keeps Unicode casing rules (final sigma,
+            # titlecase digraphs, "ß" → "Ss") that per-character upper() breaks.
+            out.append("".join(word).capitalize())
+            word.clear()
+    if word:
+        out.append("".join(word).capitalize())
+
+    if len(out) == 1:
         return ""
-
-    camel = "".join(w.capitalize() for w in words)
-    return f"#{camel}"
+    return "".join(out)
 
 
 def build_hashtags_from_exif_subject(
@@ -278,31 +619,31 @@ def build_hashtags_from_exif_subject(
     weighted_list = _split_subject_values(weighted_raw)
     subject_list = _split_subject_values(subject_raw)
 
-    # Preserve order: start with weighted, then add non-duplicates from Subject
-    candidates: list[str] = []
+    hashtags: list[str] = []
     seen_raw: set[str] = set()
+    seen_tags: set[str] = set()
 
-    for src in (weighted_list, subject_list):
-        for item in src:
-            key = item.strip()
-            if not key or key in seen_raw:
-                continue
-            seen_raw.add(key)
-            candidates.append(key)
+    clean = _clean_subject_keyword
+    to_tag = _to_hashtag
 
-    hashtags: list[str] = []
-    seen_tags: set[str] = set()
+    # Preserve order: start with weighted, then add non-duplicates from Subject.
+    # Stops as soon as max_tags is reached, so Subject is often never touched.
+    for item in chain(weighted_list, subject_list):
+        key = item.strip()
+        if not key or key in seen_raw:
+            continue
+        seen_raw.add(key)
 
-    for raw in candidates:
-        cleaned = _clean_subject_keyword(raw)
+        cleaned = clean(key)
         if cleaned is None:
             continue
 
-        tag = _to_hashtag(cleaned)
-        if tag.lower() in seen_tags:
+        tag = to_tag(cleaned)
+        tag_key = tag.lower()
+        if not tag or tag_key in seen_tags:
             continue
 
-        seen_tags.add(tag.lower())
+        seen_tags.add(tag_key)
         hashtags.append(tag)
 
         if len(hashtags) >= max_tags:
@@ -316,17 +657,26 @@ def build_hashtags_from_exif_subject(
 
 def collect_image_paths(inputs: list[str]) -> list[Path]:
     result = []
+    image_exts = IMAGE_EXTS
+    splitext = os.path.splitext
     for raw in inputs:
         p = Path(raw).expanduser()
         if p.is_dir():
-            for child in sorted(p.iterdir()):
-                if child.is_file() and child.suffix.lower() in IMAGE_EXTS:
-                    result.append(child)
+            # DirEntry.is_file() answers from the cached dirent type, so
+            # regular files cost no extra stat() call.
+            with os.scandir(p) as it:
+                entries = [
+                    e
+                    for e in it
+                    if splitext(e.name)[1].lower() in image_exts and e.is_file()
+                ]
+            entries.sort(key=lambda e: e.name)
+            result.extend(p / e.name for e in entries)
         elif p.is_file():
-            if p.suffix.lower() in IMAGE_EXTS:
+            if splitext(p.name)[1].lower() in image_exts:
                 result.append(p)
         else:
-            print(f"Warning: path not found: {p}")
+            log.warning("Warning: path not found: %s", p)
 
     if not result:
         raise RuntimeError("No image files found.")
@@ -336,6 +686,30 @@ def collect_image_paths(inputs: list[str]) -> list[Path]:
 
 # ----------------- Posting ----------------- #
 
+# Media uploads are the heavy requests; cap them separately so a large
+# batch doesn't hammer the instance and trip its rate limits.
+MAX_CONCURRENT_UPLOADS = 4
+_upload_slots = threading.BoundedSemaphore(MAX_CONCURRENT_UPLOADS)
+
+# Gap between consecutive scheduled toots
+SCHEDULE_INTERVAL = timedelta(minutes=10)
+
+# Write buffer for the posted/failed helper files (1 MiB)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+def build_schedule(total: int, start_time: datetime) -> list[datetime | None]:
+    """
+    Scheduled times for `total` toots, in UTC.
+    The first toot is immediate (None); each subsequent toot is
+    SCHEDULE_INTERVAL after the previous.
+    """
+    if total <= 0:
+        return []
+    schedules: list[datetime | None] = [None]
+    schedules.extend(start_time + SCHEDULE_INTERVAL * i for i in range(1, total))
+    return schedules
+
 
 def post_single_image(
     mastodon: Mastodon,
@@ -343,8 +717,12 @@ def post_single_image(
     text_override: str | None,
     visibility: str,
     scheduled_at: datetime | None = None,
+    meta_cache: dict[Path, dict[str, Any]] | None = None,
+    cache_key: str | None = None,
 ) -> str:
-    title, description, alt_text, hashtags = extract_metadata(path)
+    title, description, alt_text, hashtags = extract_metadata(
+        path, meta_cache, cache_key
+    )
 
     status_text = text_override or build_default_status_text(title, description)
 
@@ -354,10 +732,11 @@ def post_single_image(
 
     # Upload media
     try:
-        media = mastodon.media_post(
-            str(path),
-            description=alt_text or None,
-        )
+        with _upload_slots:
+            media = mastodon.media_post(
+                str(path),
+                description=alt_text or None,
+            )
     except (MastodonAPIError, MastodonUnauthorizedError) as e:
         # MastodonAPIError.args is typically:
         # ('Mastodon API returned error', status_code, reason, error_msg)
@@ -405,78 +784,167 @@ def post_images_command(inputs, text_override, visibility):
     paths = collect_image_paths(inputs)
 
     total = len(paths)
-    print(f"Found {total} image(s) to post.")
+    log.info("Found %d image(s) to post.", total)
+
+    # One exiftool process for the whole batch instead of one per image,
+    # skipping images already in the persistent metadata cache. Keys are
+    # computed once here and handed to the workers.
+    cache_keys = {p: _exif_cache_key(p) for p in paths}
+    meta_cache = run_exiftool_batch(
+        [p for p in paths if _cached_metadata(cache_keys[p]) is None]
+    )
 
     # Track successes and failures
     posted: list[tuple[Path, str, datetime | None]] = []
     failed: list[tuple[Path, str]] = []
 
-    # Start scheduling timestamps in UTC.
-    # First toot is immediate; each subsequent toot is 10 minutes after the previous.
-    start_time = datetime.now(UTC)
-
-    for idx, p in enumerate(paths, start=1):
-        if idx == 1:
-            scheduled_at = None  # first toot: immediate
-            sched_label = "immediately"
-        else:
-            scheduled_at = start_time + timedelta(minutes=10 * (idx - 1))
-            sched_label = scheduled_at.isoformat()
-
-        print(f"\n[{idx}/{total}] Posting {p.name} (scheduled at {sched_label})...")
+    # (idx, path, scheduled_at) for every image, with the start time captured
+    # once here rather than lazily per post.
+    schedules = build_schedule(total, datetime.now(UTC))
+    plan = [
+        (idx, p, scheduled_at)
+        for idx, (p, scheduled_at) in enumerate(
+            zip(paths, schedules, strict=True), start=1
+        )
+    ]
 
-        try:
-            url = post_single_image(
+    # Uploads are network-bound, so run them concurrently. Scheduled times
+    # are fixed up front, so the order posts finish in doesn't matter.
+    pool = ThreadPoolExecutor(max_workers=min(MAX_POST_WORKERS, total))
+    jobs = []
+    reported = 0
+    try:
+        for idx, p, scheduled_at in plan:
+            future = pool.submit(
+                post_single_image,
                 mastodon=mastodon,
                 path=p,
                 text_override=text_override,
                 visibility=visibility,
                 scheduled_at=scheduled_at,
+                meta_cache=meta_cache,
+                cache_key=cache_keys[p],
             )
-        except RuntimeError as e:
-            msg = str(e)
-            print(f"Error: {msg}")
-            failed.append((p, msg))
-            continue
+            jobs.append((idx, p, scheduled_at, future))
+
+        # Report in input order; later uploads keep running in the background
+        # while we wait on earlier ones.
+        for job in jobs:
+            _report_post(*job, total=total, posted=posted, failed=failed)
+            reported += 1
+    except BaseException:
+        # Ctrl-C or an unexpected error: start nothing new, but wait for the
+        # uploads already in flight so every live toot ends up in a file.
+        pool.shutdown(cancel_futures=True)
+        for idx, p, scheduled_at, future in jobs[reported:]:
+            if future.cancelled():
+                failed.append((p, "Not posted: run was interrupted"))
+            else:
+                _report_post(
+                    idx,
+                    p,
+                    scheduled_at,
+                    future,
+                    total=total,
+                    posted=posted,
+                    failed=failed,
+                )
+        for _idx, p, _scheduled_at in plan[len(jobs) :]:
+            failed.append((p, "Not posted: run was interrupted"))
+        raise
+    finally:
+        pool.shutdown()
+        # Always write helper files so you can easily retry failures
+        _write_post_results(posted, failed, total)
+
+
+def _report_post(
+    idx: int,
+    path: Path,
+    scheduled_at: datetime | None,
+    future: Future[str],
+    *,
+    total: int,
+    posted: list[tuple[Path, str, datetime | None]],
+    failed: list[tuple[Path, str]],
+) -> None:
+    """Wait for one post to finish, log its outcome and record it."""
+    if scheduled_at is None:
+        sched_label = "immediately"
+    else:
+        sched_label = scheduled_at.isoformat()
+
+    log.info(
+        "\n[%d/%d] Posting %s (scheduled at %s)...",
+        idx,
+        total,
+        path.name,
+        sched_label,
+    )
 
-        if url:
-            print(f"Done → {url}")
+    try:
+        url = future.result()
+    except RuntimeError as e:
+        msg = str(e)
+    except Exception as e:
+        # Network errors etc. aren't wrapped by post_single_image; record them
+        # as failures instead of abandoning the rest of the run.
+        msg = f"Unexpected error posting {path.name}: {e!r}"
+    else:
+        msg = None
+
+    if msg is not None:
+        log.error("Error: %s", msg)
+        failed.append((path, msg))
+        return
+
+    if url:
+        log.info("Done → %s", url)
+    else:
+        if scheduled_at is None:
+            log.info("Done → (no URL returned)")
         else:
-            if scheduled_at is None:
-                print("Done → (no URL returned)")
-            else:
-                print(f"Done → (scheduled for {scheduled_at.isoformat()})")
+            log.info("Done → (scheduled for %s)", scheduled_at.isoformat())
+
+    posted.append((path, url, scheduled_at))
 
-        posted.append((p, url, scheduled_at))
 
-    # After the loop, write helper files so you can easily retry failures
+def _write_post_results(
+    posted: list[tuple[Path, str, datetime | None]],
+    failed: list[tuple[Path, str]],
+    total: int,
+) -> None:
     cwd = Path.cwd()
 
     if posted:
         posted_file = cwd / "photo-tooter-posted.txt"
-        with posted_file.open("w", encoding="utf-8") as f:
-            for path, url, sched in posted:
-                sched_str = sched.isoformat() if sched is not None else ""
-                # path, url (may be empty if scheduled), scheduled_at (maybe empty)
-                f.write(f"{path}\t{url}\t{sched_str}\n")
-        print(
-            f"\n✅ Posted/scheduled {len(posted)}/{total} image(s). "
-            f"Details written to: {posted_file}"
+        with posted_file.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+            # path, url (may be empty if scheduled), scheduled_at (maybe empty)
+            f.writelines(
+                f"{path}\t{url}\t{sched.isoformat() if sched is not None else ''}\n"
+                for path, url, sched in posted
+            )
+        log.info(
+            "\n✅ Posted/scheduled %d/%d image(s). Details written to: %s",
+            len(posted),
+            total,
+            posted_file,
         )
 
     if failed:
         failed_file = cwd / "photo-tooter-failed.txt"
-        with failed_file.open("w", encoding="utf-8") as f:
-            for path, _msg in failed:
-                # One path per line so it can be reused directly on the CLI
-                f.write(f"{path}\n")
-        print(f"⚠️ {len(failed)} image(s) failed. Paths written to: {failed_file}")
-        print(
-            "You can retry just the failures with:\n"
-            f"  photo-tooter post $(cat {failed_file.name})"
+        with failed_file.open("w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
+            # One path per line so it can be reused directly on the CLI
+            f.writelines(f"{path}\n" for path, _msg in failed)
+        log.warning(
+            "⚠️ %d image(s) failed. Paths written to: %s", len(failed), failed_file
         )
-    else:
-        print(f"\n🎉 All {total} image(s) posted/scheduled successfully.")
+        log.info(
+            "You can retry just the failures with:\n  photo-tooter post $(cat %s)",
+            failed_file.name,
+        )
+    elif len(posted) == total:
+        log.info("\n🎉 All %d image(s) posted/scheduled successfully.", total)
 
 
 # ----------------- Unschedule All ----------------- #
@@ -487,14 +955,14 @@ def unschedule_all_command():
     scheduled = mastodon.scheduled_statuses()
 
     if not scheduled:
-        print("No scheduled toots found.")
+        log.info("No scheduled toots found.")
         return
 
-    print(f"Found {len(scheduled)} scheduled toots. Deleting...")
+    log.info("Found %d scheduled toots. Deleting...", len(scheduled))
 
     for item in scheduled:
         sid = item["id"]
         mastodon.scheduled_status_delete(sid)
-        print(f"Deleted scheduled toot ID {sid}")
+        log.info("Deleted scheduled toot ID %s", sid)
 
-    print("All scheduled toots deleted.")
+    log.info("All scheduled toots deleted.")
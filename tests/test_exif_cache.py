@@ -0,0 +1,100 @@
+import orjson
+import pytest
+
+from photo_tooter import metadata
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "exif-cache.json"
+    monkeypatch.setattr(metadata, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(metadata, "EXIF_CACHE_FILE", path)
+    monkeypatch.setattr(metadata, "_exif_cache", None)
+    monkeypatch.setattr(metadata, "_exif_cache_dirty", False)
+    return path
+
+
+def _image(tmp_path, name="a.jpg"):
+    path = tmp_path / name
+    path.write_bytes(b"x")
+    return path
+
+
+def _write_cache(path, entries):
+    payload = {"version": metadata.EXIF_CACHE_VERSION, "entries": entries}
+    path.write_bytes(orjson.dumps(payload))
+
+
+def _saved_entries(cache_file):
+    return orjson.loads(cache_file.read_bytes())["entries"]
+
+
+def test_round_trip(tmp_path, cache_file):
+    key = metadata._exif_cache_key(_image(tmp_path))
+    result = ("Title", "Description", None, ["#Tag"])
+
+    metadata._store_metadata(key, result)
+    metadata._save_exif_cache()
+    metadata._exif_cache = None
+
+    assert metadata._cached_metadata(key) == result
+
+
+def test_key_changes_when_file_changes(tmp_path, cache_file):
+    image = _image(tmp_path)
+    key = metadata._exif_cache_key(image)
+    image.write_bytes(b"bigger")
+    assert metadata._exif_cache_key(image) != key
+
+
+@pytest.mark.parametrize("entries", [["not", "a", "dict"], "junk", 42])
+def test_entries_not_a_dict_is_ignored(tmp_path, cache_file, entries):
+    key = metadata._exif_cache_key(_image(tmp_path))
+    _write_cache(cache_file, entries)
+
+    assert metadata._cached_metadata(key) is None
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        ["Title", None, None, []],
+        ["Title", None, None, ["#Tag"], 1, "extra"],
+        {"title": "Title"},
+        ["Title", None, None, "#Tag", 1],
+        [1, None, None, [], 1],
+        ["Title", None, None, [], "yesterday"],
+    ],
+)
+def test_malformed_entry_is_ignored(tmp_path, cache_file, entry):
+    key = metadata._exif_cache_key(_image(tmp_path))
+    _write_cache(cache_file, {key: entry})
+
+    assert metadata._cached_metadata(key) is None
+
+
+def test_save_keeps_entries_for_missing_files(tmp_path, cache_file):
+    # e.g. photos on an external drive that isn't mounted right now
+    image = _image(tmp_path)
+    key = metadata._exif_cache_key(image)
+    metadata._store_metadata(key, ("T", None, None, []))
+    image.unlink()
+
+    metadata._save_exif_cache()
+
+    assert list(_saved_entries(cache_file)) == [key]
+
+
+def test_save_evicts_least_recently_used(tmp_path, cache_file, monkeypatch):
+    monkeypatch.setattr(metadata, "EXIF_CACHE_MAX_ENTRIES", 2)
+    clock = iter(range(100, 200))
+    monkeypatch.setattr(metadata.time, "time", lambda: next(clock))
+    keys = [metadata._exif_cache_key(_image(tmp_path, f"{i}.jpg")) for i in range(3)]
+    for key in keys:
+        metadata._store_metadata(key, ("T", None, None, []))
+
+    # Using the oldest entry again makes the second one the eviction candidate
+    metadata._cached_metadata(keys[0])
+    metadata._save_exif_cache()
+
+    assert set(_saved_entries(cache_file)) == {keys[0], keys[2]}
@@ -0,0 +1,31 @@
+import os
+import subprocess
+
+import orjson
+
+from photo_tooter import metadata
+
+
+def _fake_exiftool(args, input, capture_output):
+    # Mimic exiftool's argfile parsing: "#" lines are comments, "-" lines options
+    lines = os.fsdecode(input).split("\n")
+    files = [line for line in lines if line and not line.startswith(("#", "-"))]
+    stdout = orjson.dumps([{"SourceFile": f, "Title": f} for f in files])
+    return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr=b"")
+
+
+def test_batch_handles_names_exiftool_would_misparse(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(metadata.subprocess, "run", _fake_exiftool)
+    paths = [
+        metadata.Path("#12 sunset.jpg"),
+        metadata.Path("-dash.jpg"),
+        tmp_path / "plain.jpg",
+    ]
+    for p in paths:
+        p.write_bytes(b"")
+
+    result = metadata.run_exiftool_batch(paths)
+
+    assert set(result) == set(paths)
+    assert result[paths[0]]["Title"] == str(tmp_path / "#12 sunset.jpg")
@@ -0,0 +1,100 @@
+import warnings
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from photo_tooter.metadata import _fast_read_tags
+
+XMP = """<?xpacket begin="" id="W5M0MpCehiHzreSzNTczkc9d"?>
+<x:xmpmeta xmlns:x="adobe:ns:meta/">
+ <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <rdf:Description rdf:about=""
+    xmlns:dc="http://purl.org/dc/elements/1.1/"
+    xmlns:Iptc4xmpCore="http://iptc.org/std/Iptc4xmpCore/1.0/xmlns/">
+   <dc:title><rdf:Alt>
+    <rdf:li xml:lang="x-default">Saguaro at dusk</rdf:li>
+   </rdf:Alt></dc:title>
+   <dc:description><rdf:Alt>
+    <rdf:li xml:lang="en-US">US description</rdf:li>
+    <rdf:li xml:lang="x-default">A tall cactus</rdf:li>
+   </rdf:Alt></dc:description>
+   <Iptc4xmpCore:AltTextAccessibility><rdf:Alt>
+    <rdf:li xml:lang="de">Ein Kaktus</rdf:li>
+   </rdf:Alt></Iptc4xmpCore:AltTextAccessibility>
+   <dc:subject><rdf:Bag>
+    <rdf:li>Saguaro cactus (Carnegiea gigantea)</rdf:li>
+    <rdf:li>Arizona</rdf:li>
+   </rdf:Bag></dc:subject>
+  </rdf:Description>
+  <rdf:Description rdf:about=""
+    xmlns:lr="http://ns.adobe.com/lightroom/1.0/">
+   <lr:weightedFlatSubject><rdf:Bag>
+    <rdf:li>Desert</rdf:li>
+   </rdf:Bag></lr:weightedFlatSubject>
+  </rdf:Description>
+ </rdf:RDF>
+</x:xmpmeta>
+<?xpacket end="w"?>"""
+
+
+def _save(path, xmp=XMP):
+    im = Image.new("RGB", (8, 8))
+    if path.suffix == ".png":
+        info = PngImagePlugin.PngInfo()
+        info.add_itxt("XML:com.adobe.xmp", xmp)
+        im.save(path, pnginfo=info)
+    else:
+        im.save(path, xmp=xmp.encode())
+    return path
+
+
+@pytest.mark.parametrize("name", ["photo.jpg", "photo.png", "photo.webp"])
+def test_reads_xmp_fields(tmp_path, name):
+    path = _save(tmp_path / name)
+
+    assert _fast_read_tags(path) == {
+        "SourceFile": str(path),
+        # Lang-alt: x-default under the plain name, other languages suffixed,
+        # exactly as exiftool -json reports them
+        "Title": "Saguaro at dusk",
+        "Description": "A tall cactus",
+        "Description-en-US": "US description",
+        "AltTextAccessibility-de": "Ein Kaktus",
+        "Subject": ["Saguaro cactus (Carnegiea gigantea)", "Arizona"],
+        # From the second rdf:Description
+        "WeightedFlatSubject": ["Desert"],
+    }
+
+
+def test_no_xmp_falls_back(tmp_path):
+    path = tmp_path / "plain.jpg"
+    Image.new("RGB", (8, 8)).save(path)
+    assert _fast_read_tags(path) is None
+
+
+def test_missing_title_and_description_falls_back(tmp_path):
+    xmp = XMP.replace("dc:title", "dc:other").replace("dc:description", "dc:note")
+    assert _fast_read_tags(_save(tmp_path / "photo.jpg", xmp)) is None
+
+
+def test_heic_is_left_to_exiftool(tmp_path):
+    path = tmp_path / "photo.heic"
+    path.write_bytes(b"not really an image")
+    assert _fast_read_tags(path) is None
+
+
+def test_large_image_does_not_warn(tmp_path, monkeypatch):
+    path = _save(tmp_path / "photo.jpg")
+    # 8x8 = 64 pixels; anything above the limit triggers the warning
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 40)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert _fast_read_tags(path)["Title"] == "Saguaro at dusk"
+
+
+def test_non_default_language_only_falls_back(tmp_path):
+    # exiftool reports an en-US-only title as "Title-en-US", not "Title"
+    xmp = XMP.replace('xml:lang="x-default">Saguaro', 'xml:lang="en-US">Saguaro')
+    xmp = xmp.replace("dc:description", "dc:note")
+    assert _fast_read_tags(_save(tmp_path / "photo.jpg", xmp)) is None
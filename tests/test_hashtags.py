@@ -0,0 +1,42 @@
+import re
+
+import pytest
+
+from photo_tooter.metadata import _to_hashtag
+
+
+def _regex_to_hashtag(keyword: str) -> str:
+    # The original regex-based implementation, kept as the reference.
+    words = re.sub(r"[^\w\s]", " ", keyword).split()
+    if not words:
+        return ""
+    return "#" + "".join(w.capitalize() for w in words)
+
+
+@pytest.mark.parametrize(
+    "keyword",
+    [
+        "Mt. Ranier",
+        "NASA",
+        "iPhone 15 pro",
+        "snake_case tag",
+        "O'Neil-Smith",
+        "  spaced   out  ",
+        "!!!",
+        "",
+        "été à Paris",
+        "ΟΔΟΣ",
+        "ßtraße",
+        "ǆungla",
+        "İstanbul",
+        "東京 タワー",
+    ],
+)
+def test_to_hashtag_matches_regex_version(keyword):
+    assert _to_hashtag(keyword) == _regex_to_hashtag(keyword)
+
+
+def test_to_hashtag_examples():
+    assert _to_hashtag("Mt. Ranier") == "#MtRanier"
+    assert _to_hashtag("ΟΔΟΣ") == "#Οδος"
+    assert _to_hashtag("!!!") == ""
@@ -0,0 +1,20 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from photo_tooter.metadata import SCHEDULE_INTERVAL, build_schedule
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.parametrize("total", [-1, 0, 1, 2, 5])
+def test_one_entry_per_toot(total):
+    assert len(build_schedule(total, START)) == max(total, 0)
+
+
+def test_first_is_immediate_then_spaced():
+    assert build_schedule(3, START) == [
+        None,
+        START + SCHEDULE_INTERVAL,
+        START + 2 * SCHEDULE_INTERVAL,
+    ]